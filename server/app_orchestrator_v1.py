@@ -1,19 +1,29 @@
 import os
-import json
 import time
 import uuid
 import hashlib
+import queue
+import shutil
 import asyncio
+import logging
+from contextlib import ExitStack, asynccontextmanager
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from time import perf_counter_ns
+from typing import Optional, Dict, Any, BinaryIO, Tuple
 
+import anyio
 import httpx
-from fastapi import FastAPI, UploadFile, File, Form
+import orjson
+from fastapi import BackgroundTasks, FastAPI, UploadFile, File, Form
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 
 APP_VERSION = "BLOCCO06_ORCHESTRATOR_v1_0"
 
+log = logging.getLogger("uvicorn.error")
+
 ROOT = Path(__file__).resolve().parents[1]
 PROOFS_DIR = ROOT / "proofs"
 SESSIONS_DIR = ROOT / "sessions"
@@ -29,6 +39,12 @@ def _env(name: str, default: str) -> str:
     v = os.getenv(name)
     return v.strip() if v and v.strip() else default
 
+
+def _join(base: str, path: str) -> str:
+    base = base.rstrip("/")
+    path = path if path.startswith("/") else "/" + path
+    return base + path
+
 CHALLENGE_BASE_URL = _env("CHALLENGE_BASE_URL", "http://127.0.0.1:5012")
 VOICE_BASE_URL = _env("VOICE_BASE_URL", "http://127.0.0.1:5011")
 FACE_BASE_URL = _env("FACE_BASE_URL", "http://127.0.0.1:5011")  # override in env if different
@@ -45,16 +61,57 @@ LIPSYNC_VALIDATE_PATH = _env("LIPSYNC_VALIDATE_PATH", "/api/lipsync/validate")
 VSR_VALIDATE_PATH = _env("VSR_VALIDATE_PATH", "/api/vsr/validate")
 FUSION_EVALUATE_PATH = _env("FUSION_EVALUATE_PATH", "/api/fusion/evaluate")
 
+# Resolved endpoint URLs (constant for the process lifetime)
+CHALLENGE_START_URL = _join(CHALLENGE_BASE_URL, CHALLENGE_START_PATH)
+CHALLENGE_VALIDATE_URL = _join(CHALLENGE_BASE_URL, CHALLENGE_VALIDATE_PATH)
+VOICE_VERIFY_URL = _join(VOICE_BASE_URL, VOICE_VERIFY_PATH)
+FACE_VERIFY_URL = _join(FACE_BASE_URL, FACE_VERIFY_PATH)
+LIPSYNC_VALIDATE_URL = _join(LIPSYNC_BASE_URL, LIPSYNC_VALIDATE_PATH)
+VSR_VALIDATE_URL = _join(VSR_BASE_URL, VSR_VALIDATE_PATH)
+FUSION_EVALUATE_URL = _join(FUSION_BASE_URL, FUSION_EVALUATE_PATH)
+
 HTTP_TIMEOUT_S = float(_env("HTTP_TIMEOUT_S", "25"))
 HTTP_RETRIES = int(_env("HTTP_RETRIES", "1"))
+HTTP_MAX_CONNECTIONS = int(_env("HTTP_MAX_CONNECTIONS", "200"))
+HTTP_MAX_KEEPALIVE = int(_env("HTTP_MAX_KEEPALIVE", "100"))
+HTTP_KEEPALIVE_EXPIRY_S = float(_env("HTTP_KEEPALIVE_EXPIRY_S", "30"))
+HTTP2 = _env("HTTP2", "1") == "1"
 
 MAX_VIDEO_MB = int(_env("MAX_VIDEO_MB", "50"))
 MAX_AUDIO_MB = int(_env("MAX_AUDIO_MB", "15"))
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+UPLOAD_POOL_BUFFERS = 32
+THREADPOOL_TOKENS = int(_env("THREADPOOL_TOKENS", "100"))
 
 # -------------------------
 # APP
 # -------------------------
-app = FastAPI(title="BLOCCO 06 Orchestrator", version=APP_VERSION)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Upload copy+hash and evidence writes run in anyio's worker threads (default cap: 40).
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_TOKENS
+
+    # One pooled client for all downstream modules (keep-alive across calls).
+    # Connect failures are retried by the transport, on the same pool.
+    transport = httpx.AsyncHTTPTransport(
+        retries=HTTP_RETRIES,
+        http2=HTTP2,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_S,
+        ),
+    )
+    app.state.http = httpx.AsyncClient(timeout=HTTP_TIMEOUT_S, transport=transport)
+    # uvicorn picks uvloop/httptools automatically when installed (uvloop: not on Windows).
+    log.info("event loop: %s", type(asyncio.get_running_loop()).__module__)
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+
+
+app = FastAPI(title="BLOCCO 06 Orchestrator", version=APP_VERSION, lifespan=lifespan)
 
 # Static UI
 if (UI_DIR / "static").exists():
@@ -72,14 +129,73 @@ def _sha256_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def _sha256_file(path: Path) -> str:
+# Reusable upload copy buffers (UPLOAD_CHUNK_BYTES each), shared across requests.
+# queue.Queue: get/put are atomic across the worker threads running _copy_upload.
+_chunk_pool: "queue.Queue[bytearray]" = queue.Queue(maxsize=UPLOAD_POOL_BUFFERS)
+
+
+def _read_into(src: BinaryIO, buf: bytearray) -> int:
+    chunk = src.read(len(buf))
+    buf[: len(chunk)] = chunk
+    return len(chunk)
+
+
+def _copy_upload(src: BinaryIO, path: Path, max_bytes: int) -> Optional[str]:
+    # Blocking; copies through a pooled chunk buffer (no per-chunk allocations).
+    try:
+        buf = _chunk_pool.get_nowait()
+    except queue.Empty:
+        buf = bytearray(UPLOAD_CHUNK_BYTES)
+    # SpooledTemporaryFile only has readinto() on 3.11+; older interpreters copy from read().
+    readinto = getattr(src, "readinto", None) or partial(_read_into, src)
+    view = memoryview(buf)
     h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+    size = 0
+    try:
+        with path.open("wb") as f:
+            while n := readinto(buf):
+                size += n
+                if size > max_bytes:
+                    break
+                f.write(view[:n])
+                h.update(view[:n])
+    finally:
+        view.release()
+        try:
+            _chunk_pool.put_nowait(buf)
+        except queue.Full:
+            pass
+    if size > max_bytes:
+        path.unlink(missing_ok=True)
+        return None
     return h.hexdigest()
 
 
+async def _save_upload(upload: UploadFile, path: Path, max_bytes: int) -> Optional[str]:
+    # Stream to disk in chunks, hashing on the way; returns the sha256,
+    # or None (partial file removed) if max_bytes is exceeded.
+    await upload.seek(0)
+    return await run_in_threadpool(_copy_upload, upload.file, path, max_bytes)
+
+
+# Per-module error mapping: (error_code, error_message, flags key in the error body)
+_MODULE_ERRORS = {
+    "challenge": ("CHALLENGE_ERROR", "challenge validate failed", None),
+    "face": ("FACE_ERROR", "face verify failed", "flags_face"),
+    "voice": ("VOICE_ERROR", "voice verify failed", "flags_voice"),
+    "lipsync": ("LIPSYNC_ERROR", "lipsync failed", "flags_lipsync"),
+    "vsr": ("VSR_ERROR", "vsr failed", "flags_vsr"),
+}
+
+
+def _add_flags(acc: Dict[str, None], new) -> None:
+    # Ordered set (unique, preserve order), capped at the 20-flag summary limit.
+    for f in new:
+        if len(acc) >= 20:
+            return
+        acc.setdefault(f, None)
+
+
 def _new_session_id() -> str:
     return "SES-" + uuid.uuid4().hex[:16].upper()
 
@@ -96,12 +212,6 @@ def _policy_to_mode(policy_id: str) -> str:
     raise ValueError("INVALID_POLICY")
 
 
-def _join(base: str, path: str) -> str:
-    base = base.rstrip("/")
-    path = path if path.startswith("/") else "/" + path
-    return base + path
-
-
 def _err(status: int, code: str, msg: str, flags=None):
     return JSONResponse(
         status_code=status,
@@ -114,47 +224,55 @@ def _err(status: int, code: str, msg: str, flags=None):
     )
 
 
+async def _timed(coro) -> Tuple[Any, int]:
+    t0 = perf_counter_ns()
+    res = await coro
+    return res, (perf_counter_ns() - t0) // 1_000_000
+
+
+def _json_object(r: httpx.Response) -> Optional[Dict[str, Any]]:
+    # Body as a JSON object, or None if it is not one (invalid JSON, list, scalar).
+    try:
+        parsed = orjson.loads(r.content)
+    except orjson.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _parse_response(r: httpx.Response) -> Dict[str, Any]:
+    # Internal modules answer JSON objects: parse the body directly, text only as fallback.
+    j = _json_object(r)
+    if r.status_code >= 400:
+        if j is not None:
+            return {"__http_error__": True, "__status__": r.status_code, "__json__": j}
+        return {"__http_error__": True, "__status__": r.status_code, "__text__": r.text[:500]}
+    return j if j is not None else {"raw": r.text}
+
+
 async def _post_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-    last_exc = None
-    for attempt in range(max(1, HTTP_RETRIES + 1)):
-        try:
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_S) as client:
-                r = await client.post(url, json=payload, headers=headers)
-                ct = r.headers.get("content-type", "")
-                if r.status_code >= 400:
-                    if "application/json" in ct:
-                        return {"__http_error__": True, "__status__": r.status_code, "__json__": r.json()}
-                    return {"__http_error__": True, "__status__": r.status_code, "__text__": r.text[:500]}
-                return r.json() if "application/json" in ct else {"raw": r.text}
-        except Exception as e:
-            last_exc = e
-            if attempt < HTTP_RETRIES:
-                await asyncio.sleep(0.05)
-    raise RuntimeError(f"HTTP_POST_JSON_FAILED: {url} :: {last_exc}")
+    client: httpx.AsyncClient = app.state.http
+    try:
+        r = await client.post(url, json=payload, headers=headers)
+        return _parse_response(r)
+    except Exception as e:
+        raise RuntimeError(f"HTTP_POST_JSON_FAILED: {url} :: {e}") from e
 
 
 async def _post_multipart(
     url: str,
     data: Dict[str, Any],
-    files: Dict[str, Tuple[str, bytes, str]],
+    files: Dict[str, Tuple[str, Path, str]],
     headers: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
-    last_exc = None
-    for attempt in range(max(1, HTTP_RETRIES + 1)):
+    client: httpx.AsyncClient = app.state.http
+    with ExitStack() as stack:
+        # Own handle per call: httpx streams the body from disk.
+        parts = {k: (name, stack.enter_context(path.open("rb")), ct) for k, (name, path, ct) in files.items()}
         try:
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_S) as client:
-                r = await client.post(url, data=data, files=files, headers=headers)
-                ct = r.headers.get("content-type", "")
-                if r.status_code >= 400:
-                    if "application/json" in ct:
-                        return {"__http_error__": True, "__status__": r.status_code, "__json__": r.json()}
-                    return {"__http_error__": True, "__status__": r.status_code, "__text__": r.text[:500]}
-                return r.json() if "application/json" in ct else {"raw": r.text}
+            r = await client.post(url, data=data, files=parts, headers=headers)
+            return _parse_response(r)
         except Exception as e:
-            last_exc = e
-            if attempt < HTTP_RETRIES:
-                await asyncio.sleep(0.05)
-    raise RuntimeError(f"HTTP_POST_MULTIPART_FAILED: {url} :: {last_exc}")
+            raise RuntimeError(f"HTTP_POST_MULTIPART_FAILED: {url} :: {e}") from e
 
 
 # -------------------------
@@ -172,7 +290,7 @@ def health():
         "version": APP_VERSION,
         "time_utc": _now_utc_iso(),
         "limits": {"max_video_mb": MAX_VIDEO_MB, "max_audio_mb": MAX_AUDIO_MB},
-        "http": {"timeout_s": HTTP_TIMEOUT_S, "retries": HTTP_RETRIES},
+        "http": {"timeout_s": HTTP_TIMEOUT_S, "retries": HTTP_RETRIES, "http2": HTTP2},
         "modules": {
             "challenge": {"base": CHALLENGE_BASE_URL, "start": CHALLENGE_START_PATH, "validate": CHALLENGE_VALIDATE_PATH},
             "voice": {"base": VOICE_BASE_URL, "verify": VOICE_VERIFY_PATH},
@@ -195,8 +313,7 @@ def ui():
 # UI calls same-origin /api/challenge/start. We proxy to CHALLENGE engine.
 @app.post("/api/challenge/start")
 async def challenge_start_proxy(payload: Dict[str, Any]):
-    url = _join(CHALLENGE_BASE_URL, CHALLENGE_START_PATH)
-    res = await _post_json(url, payload)
+    res = await _post_json(CHALLENGE_START_URL, payload)
     if res.get("__http_error__"):
         j = res.get("__json__") or {}
         return _err(res.get("__status__", 500), "CHALLENGE_START_ERROR", "challenge start failed", flags=j.get("flags_summary") or [])
@@ -205,6 +322,7 @@ async def challenge_start_proxy(payload: Dict[str, Any]):
 
 @app.post("/api/multimodal/verify")
 async def multimodal_verify(
+    background_tasks: BackgroundTasks,
     policy_id: str = Form(...),
     enrollment_id_face: str = Form(...),
     enrollment_id_voice: Optional[str] = Form(None),
@@ -216,8 +334,8 @@ async def multimodal_verify(
     clip_video: UploadFile = File(...),
     clip_audio: Optional[UploadFile] = File(None),
 ):
-    t0 = time.time()
-    flags_summary = []
+    t0 = perf_counter_ns()
+    flags: Dict[str, None] = {}
 
     # 1) Validate policy & required fields
     try:
@@ -235,33 +353,36 @@ async def multimodal_verify(
         return _err(400, "MISSING_FIELD", "clip_audio required for STRICT_STANDARD")
 
     if policy_id == "STRICT_SILENT" and clip_audio is not None:
-        flags_summary.append("AUDIO_IGNORED_SILENT")
+        _add_flags(flags, ["AUDIO_IGNORED_SILENT"])
 
-    # 2) Read + size guard (demo safety)
-    video_bytes = await clip_video.read()
-    if len(video_bytes) > MAX_VIDEO_MB * 1024 * 1024:
+    # 2) Read + size guard (demo safety) + 3) Persist raw media (session)
+    # Uploads are streamed straight to disk; nothing is buffered whole in memory.
+    # Reject on the parsed part size first, before touching disk.
+    if clip_video.size and clip_video.size > MAX_VIDEO_MB * 1024 * 1024:
         return _err(413, "VIDEO_TOO_LARGE", f"clip_video exceeds {MAX_VIDEO_MB}MB")
+    if policy_id == "STRICT_STANDARD" and clip_audio is not None and clip_audio.size and clip_audio.size > MAX_AUDIO_MB * 1024 * 1024:
+        return _err(413, "AUDIO_TOO_LARGE", f"clip_audio exceeds {MAX_AUDIO_MB}MB")
 
-    audio_bytes = None
-    if policy_id == "STRICT_STANDARD" and clip_audio is not None:
-        audio_bytes = await clip_audio.read()
-        if len(audio_bytes) > MAX_AUDIO_MB * 1024 * 1024:
-            return _err(413, "AUDIO_TOO_LARGE", f"clip_audio exceeds {MAX_AUDIO_MB}MB")
-
-    # 3) Persist raw media (session)
     session_id = _new_session_id()
     ses_dir = SESSIONS_DIR / session_id / "raw"
     ses_dir.mkdir(parents=True, exist_ok=True)
 
     video_ext = Path(clip_video.filename or "clip_video.bin").suffix or ".bin"
     video_path = ses_dir / f"clip_video{video_ext}"
-    video_path.write_bytes(video_bytes)
+    sha_video = await _save_upload(clip_video, video_path, MAX_VIDEO_MB * 1024 * 1024)
+    if sha_video is None:
+        shutil.rmtree(SESSIONS_DIR / session_id, ignore_errors=True)
+        return _err(413, "VIDEO_TOO_LARGE", f"clip_video exceeds {MAX_VIDEO_MB}MB")
 
     audio_path = None
-    if policy_id == "STRICT_STANDARD" and audio_bytes is not None:
-        audio_ext = Path((clip_audio.filename if clip_audio else "clip_audio.bin") or "clip_audio.bin").suffix or ".bin"
+    sha_audio = None
+    if policy_id == "STRICT_STANDARD" and clip_audio is not None:
+        audio_ext = Path(clip_audio.filename or "clip_audio.bin").suffix or ".bin"
         audio_path = ses_dir / f"clip_audio{audio_ext}"
-        audio_path.write_bytes(audio_bytes)
+        sha_audio = await _save_upload(clip_audio, audio_path, MAX_AUDIO_MB * 1024 * 1024)
+        if sha_audio is None:
+            shutil.rmtree(SESSIONS_DIR / session_id, ignore_errors=True)
+            return _err(413, "AUDIO_TOO_LARGE", f"clip_audio exceeds {MAX_AUDIO_MB}MB")
 
     metadata = {
         "session_id": session_id,
@@ -276,118 +397,99 @@ async def multimodal_verify(
             "clip_audio": str(audio_path.name) if audio_path else None,
         },
     }
-    (ses_dir / "metadata.json").write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    # Evidence only (nothing downstream reads it): overlap the write with the module calls.
+    md_task = asyncio.create_task(
+        run_in_threadpool((ses_dir / "metadata.json").write_bytes, orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    )
 
     timings = {"total": 0, "challenge": 0, "voice": 0, "face": 0, "lipsync": 0, "vsr": 0, "fusion": 0}
 
     headers = {"X-Veritas-Session": session_id}
 
-    # 4) Challenge validate (BLOCCO 02)
-    t_ch0 = time.time()
-    ch_url = _join(CHALLENGE_BASE_URL, CHALLENGE_VALIDATE_PATH)
-    ch_files = {
-        "clip_video": (video_path.name, video_bytes, clip_video.content_type or "application/octet-stream"),
-    }
-    ch_data = {"challenge_id": challenge_id, "mode": mode}
-    if policy_id == "STRICT_STANDARD" and audio_bytes is not None and audio_path is not None:
-        ch_files["clip_audio"] = (audio_path.name, audio_bytes, clip_audio.content_type or "application/octet-stream")
+    # 4) Challenge validate (BLOCCO 02) + 5) Modules
+    # Independent of each other (only fusion needs their results): run them concurrently.
+    calls = {}
 
-    ch_res = await _post_multipart(ch_url, data=ch_data, files=ch_files, headers=headers)
-    timings["challenge"] = int((time.time() - t_ch0) * 1000)
-
-    if ch_res.get("__http_error__"):
-        j = ch_res.get("__json__") or {}
-        return _err(ch_res.get("__status__", 500), "CHALLENGE_ERROR", "challenge validate failed", flags=j.get("flags_summary") or [])
-
-    challenge_score = ch_res.get("score_challenge")
-    challenge_decision = ch_res.get("decision_challenge")
-    flags_summary += (ch_res.get("flags_challenge") or ch_res.get("flags") or [])
+    # Multipart file parts built once and shared by every downstream call.
+    video_part = (video_path.name, video_path, clip_video.content_type or "application/octet-stream")
+    audio_part = (audio_path.name, audio_path, clip_audio.content_type or "application/octet-stream") if audio_path else None
 
-    # 5) Modules
-    voice_score = None
-    face_score = None
-    lipsync_score = None
-    vsr_score = None
+    ch_files = {"clip_video": video_part}
+    ch_data = {"challenge_id": challenge_id, "mode": mode}
+    if audio_part is not None:
+        ch_files["clip_audio"] = audio_part
+    calls["challenge"] = _post_multipart(CHALLENGE_VALIDATE_URL, data=ch_data, files=ch_files, headers=headers)
 
     # 5A) Face verify
-    t_f0 = time.time()
-    face_url = _join(FACE_BASE_URL, FACE_VERIFY_PATH)
-    face_res = await _post_multipart(
-        face_url,
+    calls["face"] = _post_multipart(
+        FACE_VERIFY_URL,
         data={"enrollment_id_face": enrollment_id_face},
-        files={"clip_video": (video_path.name, video_bytes, clip_video.content_type or "application/octet-stream")},
+        files={"clip_video": video_part},
         headers=headers,
     )
-    timings["face"] = int((time.time() - t_f0) * 1000)
-
-    if face_res.get("__http_error__"):
-        j = face_res.get("__json__") or {}
-        return _err(face_res.get("__status__", 500), "FACE_ERROR", "face verify failed", flags=j.get("flags_face") or j.get("flags_summary") or [])
-
-    face_score = face_res.get("score_face_match") or face_res.get("face_score")
-    flags_summary += (face_res.get("flags_face") or face_res.get("flags") or [])
 
     # 5B) Voice verify + Lipsync (STRICT_STANDARD)
-    if policy_id == "STRICT_STANDARD" and audio_bytes is not None and audio_path is not None:
-        t_v0 = time.time()
-        voice_url = _join(VOICE_BASE_URL, VOICE_VERIFY_PATH)
-        voice_res = await _post_multipart(
-            voice_url,
+    if audio_part is not None:
+        calls["voice"] = _post_multipart(
+            VOICE_VERIFY_URL,
             data={"enrollment_id_voice": enrollment_id_voice},
-            files={"clip_audio": (audio_path.name, audio_bytes, clip_audio.content_type or "application/octet-stream")},
+            files={"clip_audio": audio_part},
             headers=headers,
         )
-        timings["voice"] = int((time.time() - t_v0) * 1000)
-
-        if voice_res.get("__http_error__"):
-            j = voice_res.get("__json__") or {}
-            return _err(voice_res.get("__status__", 500), "VOICE_ERROR", "voice verify failed", flags=j.get("flags_voice") or j.get("flags_summary") or [])
 
-        voice_score = voice_res.get("score_voice_match") or voice_res.get("voice_score")
-        flags_summary += (voice_res.get("flags_voice") or voice_res.get("flags") or [])
-
-        t_l0 = time.time()
-        lipsync_url = _join(LIPSYNC_BASE_URL, LIPSYNC_VALIDATE_PATH)
-        lipsync_res = await _post_multipart(
-            lipsync_url,
+        calls["lipsync"] = _post_multipart(
+            LIPSYNC_VALIDATE_URL,
             data={"challenge_id": challenge_id},
             files={
-                "clip_video": (video_path.name, video_bytes, clip_video.content_type or "application/octet-stream"),
-                "clip_audio": (audio_path.name, audio_bytes, clip_audio.content_type or "application/octet-stream"),
+                "clip_video": video_part,
+                "clip_audio": audio_part,
             },
             headers=headers,
         )
-        timings["lipsync"] = int((time.time() - t_l0) * 1000)
-
-        if lipsync_res.get("__http_error__"):
-            j = lipsync_res.get("__json__") or {}
-            return _err(lipsync_res.get("__status__", 500), "LIPSYNC_ERROR", "lipsync failed", flags=j.get("flags_lipsync") or j.get("flags_summary") or [])
-
-        lipsync_score = lipsync_res.get("score_lipsync") or lipsync_res.get("lipsync_score")
-        flags_summary += (lipsync_res.get("flags_lipsync") or lipsync_res.get("flags") or [])
 
     # 5C) VSR (STRICT_SILENT)
     if policy_id == "STRICT_SILENT":
-        t_s0 = time.time()
-        vsr_url = _join(VSR_BASE_URL, VSR_VALIDATE_PATH)
-        vsr_res = await _post_multipart(
-            vsr_url,
+        calls["vsr"] = _post_multipart(
+            VSR_VALIDATE_URL,
             data={"challenge_id": challenge_id},
-            files={"clip_video": (video_path.name, video_bytes, clip_video.content_type or "application/octet-stream")},
+            files={"clip_video": video_part},
             headers=headers,
         )
-        timings["vsr"] = int((time.time() - t_s0) * 1000)
 
-        if vsr_res.get("__http_error__"):
-            j = vsr_res.get("__json__") or {}
-            return _err(vsr_res.get("__status__", 500), "VSR_ERROR", "vsr failed", flags=j.get("flags_vsr") or j.get("flags_summary") or [])
+    gathered = await asyncio.gather(*(_timed(c) for c in calls.values()), return_exceptions=True)
+    await md_task
+    # Inspect in pipeline order: the first failing module decides the response,
+    # exactly as when the calls ran one after another.
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, out in zip(calls, gathered):
+        if isinstance(out, BaseException):
+            raise out
+        res, timings[name] = out
+        if res.get("__http_error__"):
+            code, msg, err_flags_key = _MODULE_ERRORS[name]
+            j = res.get("__json__") or {}
+            return _err(res.get("__status__", 500), code, msg, flags=(err_flags_key and j.get(err_flags_key)) or j.get("flags_summary") or [])
+        _add_flags(flags, res.get(f"flags_{name}") or res.get("flags") or [])
+        results[name] = res
+
+    ch_res = results["challenge"]
+    challenge_score = ch_res.get("score_challenge")
+    challenge_decision = ch_res.get("decision_challenge")
+
+    face_res = results["face"]
+    face_score = face_res.get("score_face_match") or face_res.get("face_score")
+
+    voice_res = results.get("voice") or {}
+    voice_score = voice_res.get("score_voice_match") or voice_res.get("voice_score")
+
+    lipsync_res = results.get("lipsync") or {}
+    lipsync_score = lipsync_res.get("score_lipsync") or lipsync_res.get("lipsync_score")
 
-        vsr_score = vsr_res.get("score_vsr") or vsr_res.get("vsr_score")
-        flags_summary += (vsr_res.get("flags_vsr") or vsr_res.get("flags") or [])
+    vsr_res = results.get("vsr") or {}
+    vsr_score = vsr_res.get("score_vsr") or vsr_res.get("vsr_score")
 
     # 6) Fusion evaluate
-    t_fu0 = time.time()
-    fusion_url = _join(FUSION_BASE_URL, FUSION_EVALUATE_PATH)
+    t_fu0 = perf_counter_ns()
     fusion_payload = {
         "policy_id": policy_id,
         "thresholds": {
@@ -405,24 +507,21 @@ async def multimodal_verify(
         },
     }
 
-    fusion_res = await _post_json(fusion_url, fusion_payload, headers=headers)
-    timings["fusion"] = int((time.time() - t_fu0) * 1000)
+    fusion_res = await _post_json(FUSION_EVALUATE_URL, fusion_payload, headers=headers)
+    timings["fusion"] = (perf_counter_ns() - t_fu0) // 1_000_000
 
     if fusion_res.get("__http_error__"):
         j = fusion_res.get("__json__") or {}
         return _err(fusion_res.get("__status__", 500), "FUSION_ERROR", "fusion evaluate failed", flags=j.get("flags_summary") or [])
 
     final_decision = fusion_res.get("final_decision") or fusion_res.get("decision") or "INCONCLUSIVE"
-    flags_summary += (fusion_res.get("flags_summary") or fusion_res.get("flags") or [])
-    flags_summary = list(dict.fromkeys(flags_summary))[:20]  # unique preserve order
+    _add_flags(flags, fusion_res.get("flags_summary") or fusion_res.get("flags") or [])
+    flags_summary = list(flags)
 
     # 7) Proof + evidence hashes
     proof_id = _new_proof_id()
     proof_path = PROOFS_DIR / f"{proof_id}.json"
 
-    sha_video = _sha256_file(video_path)
-    sha_audio = _sha256_file(audio_path) if audio_path else None
-
     proof_obj = {
         "proof_version": "proof_multimodal_v1",
         "proof_id": proof_id,
@@ -461,18 +560,18 @@ async def multimodal_verify(
         "timings_ms": timings,
     }
 
-    proof_path.write_text(json.dumps(proof_obj, indent=2), encoding="utf-8")
-
-    sha_proof = _sha256_file(proof_path)
-    (ses_dir / "sha256.json").write_text(
-        json.dumps(
-            {"clip_video_sha256": sha_video, "clip_audio_sha256": sha_audio, "proof_sha256": sha_proof},
-            indent=2,
-        ),
-        encoding="utf-8",
+    proof_data = orjson.dumps(proof_obj, option=orjson.OPT_INDENT_2)
+    sha_proof = _sha256_bytes(proof_data)
+    sha_data = orjson.dumps(
+        {"clip_video_sha256": sha_video, "clip_audio_sha256": sha_audio, "proof_sha256": sha_proof},
+        option=orjson.OPT_INDENT_2,
     )
 
-    timings["total"] = int((time.time() - t0) * 1000)
+    await run_in_threadpool(proof_path.write_bytes, proof_data)
+    # sha256.json is written after the response is sent.
+    background_tasks.add_task((ses_dir / "sha256.json").write_bytes, sha_data)
+
+    timings["total"] = (perf_counter_ns() - t0) // 1_000_000
 
     return {
         "ok": True,